@@ -1,13 +1,23 @@
 """Abstract implementation of the DALI interface class."""
 
 import logging
+import os
 import queue
 import threading
-import time
+from collections import namedtuple
 from enum import IntEnum
-from typing import NamedTuple
+from functools import lru_cache
+
+if os.environ.get("DALI_TYPECHECK"):
+    from typeguard import typechecked
+else:
+    # Runtime type checking wraps every call with reflective argument
+    # inspection, which is measurable on the per-frame paths. Only enable
+    # it when explicitly requested.
+    def typechecked(target):  # type: ignore[misc]
+        """Pass-through replacement for typeguard.typechecked."""
+        return target
 
-from typeguard import typechecked
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +37,39 @@ class DaliStatus(IntEnum):
     UNDEFINED = 9
 
 
-class DaliFrame(NamedTuple):
+class DaliFrame(
+    # collections.namedtuple constructs noticeably faster than typing.NamedTuple,
+    # which matters at one instance per received frame
+    namedtuple(
+        "DaliFrame",
+        ("timestamp", "length", "data", "priority", "send_twice", "status", "message"),
+        defaults=(0, 0, 0, 2, False, DaliStatus.OK, "OK"),
+    )
+):
     """DALI frame object."""
 
-    timestamp: float = 0
-    length: int = 0
-    data: int = 0
-    priority: int = 2
-    send_twice: bool = False
-    status: int = DaliStatus.OK
-    message: str = "OK"
+    __slots__ = ()
+
+    # data width for the repr, selected by frame length with a single dict probe
+    _HEX_FMT = {8: "0x%02X", 16: "0x%04X", 24: "0x%06X", 32: "0x%08X"}
+
+    def __repr__(self) -> str:
+        """Compact representation with the data formatted to the frame length."""
+        data = DaliFrame._HEX_FMT.get(self.length, "0x%08X") % self.data
+        return (
+            f"DaliFrame(timestamp={self.timestamp}, length={self.length}, "
+            f"data={data}, status={self.status}, message={self.message})"
+        )
+
+
+# frames without payload that are returned over and over, cached so the hot
+# paths hand out the same immutable instance instead of allocating a new one
+_QUEUE_TIMEOUT_FRAME = DaliFrame(
+    status=DaliStatus.TIMEOUT, message="queue is empty, timeout from get"
+)
+_QUEUE_NONE_FRAME = DaliFrame(
+    status=DaliStatus.GENERAL, message="received None from queue"
+)
 
 
 @typechecked
@@ -44,23 +77,30 @@ class DaliInterface:
     """Abstract DALI interface class."""
 
     RECEIVE_TIMEOUT = 1
-    SLEEP_FOR_THREAD_END = 0.001
 
     def __init__(self, max_queue_size: int = 40, start_receive: bool = True) -> None:
         """Initialize DALI interface.
 
         Args:
-            max_queue_size (int, optional): Length of input queue for frames read from DALI bus.
-                Defaults to 40.
+            max_queue_size (int, optional): Unused, kept for backwards compatibility.
+                The input queue is unbounded so the read thread never blocks on a
+                slow consumer.
             start_receive (bool, optional): Start a thread that reads DAL frames from the bus
                 and transfers them into the input queue.
                 Defaults to True.
         """
-        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
-        self.keep_running = False
+        del max_queue_size  # kept in the signature for backwards compatibility
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._stop.set()
         if start_receive:
             self.__start_receive()
 
+    @property
+    def keep_running(self) -> bool:
+        """True while the receive thread is supposed to run."""
+        return not self._stop.is_set()
+
     def __enter__(self):
         """Access object via context manager"""
         return self
@@ -77,23 +117,31 @@ class DaliInterface:
         """Stub for reading data needs to be overwritten by an implementation."""
         raise NotImplementedError("subclass must implement read_data")
 
+    def _cancel_read(self) -> None:
+        """Stub for unblocking a pending read_data call, used by close()."""
+
     def flush_queue(self) -> None:
         """Flush the queue with DALI frames."""
-        while not self.queue.empty():
-            self.queue.get()
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
 
     def __read_worker_thread(self):
         """The read thread which is executed to read DALI frames from the interface."""
         logger.debug("read_worker_thread started")
-        while self.keep_running:
-            self.read_data()
+        read_data = self.read_data
+        stop_requested = self._stop.is_set
+        while not stop_requested():
+            read_data()
         logger.debug("read_worker_thread terminated")
 
     def __start_receive(self) -> None:
         """Start the receive thread which fille the queue with DALI frames."""
         if not self.keep_running:
             logger.debug("start receive")
-            self.keep_running = True
+            self._stop.clear()
             self.thread = threading.Thread(target=self.__read_worker_thread, args=())
             self.thread.daemon = True
             self.thread.start()
@@ -116,24 +164,69 @@ class DaliInterface:
         try:
             rx_frame = self.queue.get(block=True, timeout=timeout)
         except queue.Empty:
-            return DaliFrame(
-                status=DaliStatus.TIMEOUT, message="queue is empty, timeout from get"
-            )
+            return _QUEUE_TIMEOUT_FRAME
         if rx_frame is None:
-            return DaliFrame(
-                status=DaliStatus.GENERAL, message="received None from queue"
+            return _QUEUE_NONE_FRAME
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"return {rx_frame.message} - {rx_frame.length} - {rx_frame.data}"
             )
-        logger.debug(f"return {rx_frame.message} - {rx_frame.length} - {rx_frame.data}")
         return rx_frame
 
+    def get_batch(self, max_n: int, timeout: float | None = None) -> list[DaliFrame]:
+        """Get up to max_n DALI frames from the interface in one call.
+            Function blocks until at least one frame is received or timeout occurs.
+
+        Args:
+            max_n (int): maximum number of frames to return.
+            timeout (float | None, optional): time in seconds before the call returns.
+                Defaults to None (never time out).
+
+        Returns:
+            list[DaliFrame]: received frames, empty list on timeout.
+        """
+        logger.debug("get_batch")
+        if not self.keep_running:
+            raise Exception("read thread is not running")
+        frames: list[DaliFrame] = []
+        try:
+            frames.append(self.queue.get(block=True, timeout=timeout))
+            while len(frames) < max_n:
+                frames.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return frames
+
     @staticmethod
-    def build_command_string(frame: DaliFrame, is_query: bool) -> str:
-        """Build a command string for a frame to send via serial connector."""
+    def build_command_string(frame: DaliFrame, is_query: bool) -> bytes:
+        """Build a command string for a frame to send via serial connector.
+        The protocol is plain ASCII, so the string is built as bytes and
+        ready to write to the port without an extra encode step."""
         if frame.length == 8:
-            return f"Y{frame.data:X}\r"
-        command = "Q" if is_query else "S"
-        twice = "+" if frame.send_twice else " "
-        return f"{command}{frame.priority} {frame.length:X}{twice}{frame.data:X}\r"
+            return b"Y%X\r" % frame.data
+        command = b"Q" if is_query else b"S"
+        twice = b"+" if frame.send_twice else b" "
+        return b"%s%d %X%s%X\r" % (
+            command,
+            frame.priority,
+            frame.length,
+            twice,
+            frame.data,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _encode_command(
+        length: int, data: int, priority: int, send_twice: bool, is_query: bool
+    ) -> bytes:
+        """Encoded command string for the given frame fields. Most DALI traffic
+        repeats the same handful of commands, so the encoded result is cached."""
+        return DaliInterface.build_command_string(
+            DaliFrame(
+                length=length, data=data, priority=priority, send_twice=send_twice
+            ),
+            is_query,
+        )
 
     def transmit(self, frame: DaliFrame, block: bool = False) -> None:
         """Transmit a DALI frame. All 8 bit frames are treated as backward frames.
@@ -164,7 +257,7 @@ class DaliInterface:
         if not self.keep_running:
             logger.debug("read thread is not running")
             return
-        self.keep_running = False
-        while self.thread.is_alive():
-            time.sleep(DaliInterface.SLEEP_FOR_THREAD_END)
+        self._stop.set()
+        self._cancel_read()
+        self.thread.join()
         logger.debug("connection closed, thread terminated")
@@ -7,9 +7,8 @@ import time
 from typing import Final, Generator
 
 import usb  # type: ignore
-from typeguard import typechecked
 
-from .dali_interface import DaliFrame, DaliInterface, DaliStatus
+from .dali_interface import DaliFrame, DaliInterface, DaliStatus, typechecked
 
 logger = logging.getLogger(__name__)
 
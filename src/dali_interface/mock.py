@@ -18,11 +18,11 @@ class DaliMock(DaliInterface):
 
     def transmit(self, frame: DaliFrame, block: bool = False) -> None:
         """Mock transmission of DALI frame."""
-        print(DaliInterface.build_command_string(frame, False))
+        print(DaliInterface.build_command_string(frame, False).decode("ascii"))
 
     def query_reply(self, request: DaliFrame) -> DaliFrame:
         """Mock DALI frame query."""
-        print(DaliInterface.build_command_string(request, False))
+        print(DaliInterface.build_command_string(request, False).decode("ascii"))
         return DaliFrame(
             timestamp=time.time(),
             length=0,
@@ -1,16 +1,48 @@
 """Specific DALI interface implementation for SevenLab serial device."""
 
 import logging
+import os
+import re
+import selectors
+import time
 from typing import Final, Tuple
 
 # TODO(sven) actually serial is a bad name choice for this module as the serial interface uses the identical name
 import serial  # type: ignore
-from typeguard import typechecked  # pylint: disable=wrong-import-order
 
-from .dali_interface import DaliFrame, DaliInterface, DaliStatus
+from .dali_interface import DaliFrame, DaliInterface, DaliStatus, typechecked
 
 logger = logging.getLogger(__name__)
 
+# cached frame for lines that do not match the protocol, see parse()
+_PARSE_ERROR_FRAME = DaliFrame(status=DaliStatus.GENERAL, message="value error")
+
+# cached results for the two frame cases that make up almost all bus traffic
+_NORMAL_RESULT: Final[Tuple[int, str]] = (DaliStatus.FRAME, "NORMAL FRAME")
+_LOOPBACK_RESULT: Final[Tuple[int, str]] = (DaliStatus.LOOPBACK, "LOOPBACK FRAME")
+
+# plain int copies of the enum members compared against on every frame,
+# avoiding the enum attribute lookup in the hot paths
+_LOOPBACK_STATUS: Final[int] = int(DaliStatus.LOOPBACK)
+_TIMEOUT_STATUS: Final[int] = int(DaliStatus.TIMEOUT)
+
+
+class _LazyMessage:  # pylint: disable=too-few-public-methods
+    """Message that defers its %-formatting until it is actually read.
+    Bit-timing errors can flood in from a noisy bus, and most of their
+    messages are never looked at."""
+
+    __slots__ = ("_fmt", "_args")
+
+    def __init__(self, fmt: str, *args) -> None:
+        self._fmt = fmt
+        self._args = args
+
+    def __str__(self) -> str:
+        return self._fmt % self._args
+
+    __repr__ = __str__
+
 
 @typechecked
 class DaliSerial(DaliInterface):
@@ -35,6 +67,20 @@ class DaliSerial(DaliInterface):
     _COMMAND_BAD: Final[int] = 0xA3
     _BUFFER_OVERFLOW: Final[int] = 0xA4
 
+    # status and message for every code without payload, resolved with one dict probe
+    _STATUS_TABLE: Final[dict[int, Tuple[int, str]]] = {
+        _TIMEOUT: (DaliStatus.TIMEOUT, "TIMEOUT"),
+        _COLLISION_LOOPBACK: (DaliStatus.TIMING, "ERROR: COLLISION DETECTED"),
+        _COLLISION_NO_CHANGE: (DaliStatus.TIMING, "ERROR: COLLISION DETECTED"),
+        _COLLISION_WRONG_STATE: (DaliStatus.TIMING, "ERROR: COLLISION DETECTED"),
+        _SYSTEM_FAILURE: (DaliStatus.FAILURE, "ERROR: SYSTEM FAILURE"),
+        _SYSTEM_RECOVERED: (DaliStatus.RECOVER, "SYSTEM RECOVER"),
+        _COMMAND_NOT_PROCESSED: (DaliStatus.INTERFACE, "ERROR: INTERFACE"),
+        _COMMAND_BAD_ARGUMENT: (DaliStatus.INTERFACE, "ERROR: INTERFACE"),
+        _QUEUE_IS_FULL: (DaliStatus.INTERFACE, "ERROR: INTERFACE"),
+        _COMMAND_BAD: (DaliStatus.INTERFACE, "ERROR: INTERFACE"),
+    }
+
     def __init__(
         self,
         portname: str,
@@ -62,13 +108,31 @@ class DaliSerial(DaliInterface):
             # Windows. That is still sufficient for some use-cases though and it's
             # better than no support at all.
             pass
+        # Line buffer for read_data: holds the trailing partial line between
+        # bulk reads so splitting works on large chunks instead of scanning
+        # the input byte by byte with one syscall each.
+        self._rx_buffer = bytearray()
+        try:
+            # Sleep on the file descriptor instead of inside a blocking read,
+            # so the worker wakes exactly when data arrives.
+            self._selector: selectors.BaseSelector | None = selectors.DefaultSelector()
+            self._fd: int | None = self.port.fileno()
+            self._selector.register(self._fd, selectors.EVENT_READ)
+            # self-pipe so close() can wake a sleeping selector immediately
+            self._wake_read, self._wake_write = os.pipe()
+            self._selector.register(self._wake_read, selectors.EVENT_READ)
+        except (AttributeError, OSError, ValueError):
+            # No pollable file descriptor (e.g. under Windows); fall back to
+            # the blocking read with the port timeout.
+            self._selector = None
+            self._fd = None
         self.transparent = transparent
         super().__init__(start_receive=start_receive)
 
     @staticmethod
-    def __get_status_and_last_error(  # pylint: disable=too-many-return-statements
+    def __get_status_and_last_error(
         length: int, data: int, loopback: bool
-    ) -> Tuple[int, str]:
+    ) -> Tuple[int, str | _LazyMessage]:
         """Interpret received information."""
         if 0 <= length <= DaliSerial._MAX_BIT_LENGTH:
             if loopback:
@@ -76,115 +140,183 @@ class DaliSerial(DaliInterface):
             return DaliStatus.FRAME, "NORMAL FRAME"
         if length < DaliSerial._TIMEOUT:
             return DaliStatus.OK, "OK"
-        if length == DaliSerial._TIMEOUT:
-            return DaliStatus.TIMEOUT, "TIMEOUT"
-        if length == DaliSerial._BAD_START_BIT_TIMING:
-            bit = data & 0x0FF
-            timer_us = (data >> 8) & 0x0FFFFF
-            return (
-                DaliStatus.TIMING,
-                f"ERROR TIMING: START - BIT: {bit} - TIME: {timer_us} USEC",
-            )
-        if length == DaliSerial._BAD_DATA_BIT_TIMING:
+        if length in (
+            DaliSerial._BAD_START_BIT_TIMING,
+            DaliSerial._BAD_DATA_BIT_TIMING,
+        ):
+            # The only status codes that carry payload in the data field.
             bit = data & 0x0FF
             timer_us = (data >> 8) & 0x0FFFFF
+            edge = "START" if length == DaliSerial._BAD_START_BIT_TIMING else "DATA"
             return (
                 DaliStatus.TIMING,
-                f"ERROR TIMING: DATA - BIT: {bit} - TIME: {timer_us} USEC",
+                _LazyMessage(
+                    "ERROR TIMING: %s - BIT: %d - TIME: %d USEC", edge, bit, timer_us
+                ),
             )
-        if length in (
-            DaliSerial._COLLISION_LOOPBACK,
-            DaliSerial._COLLISION_NO_CHANGE,
-            DaliSerial._COLLISION_WRONG_STATE,
-        ):
-            return DaliStatus.TIMING, "ERROR: COLLISION DETECTED"
-        if length == DaliSerial._SYSTEM_FAILURE:
-            return DaliStatus.FAILURE, "ERROR: SYSTEM FAILURE"
-        if length == DaliSerial._SYSTEM_RECOVERED:
-            return DaliStatus.RECOVER, "SYSTEM RECOVER"
-        if length in (
-            DaliSerial._COMMAND_NOT_PROCESSED,
-            DaliSerial._COMMAND_BAD_ARGUMENT,
-            DaliSerial._QUEUE_IS_FULL,
-            DaliSerial._COMMAND_BAD,
-        ):
-            return DaliStatus.INTERFACE, "ERROR: INTERFACE"
-        return DaliStatus.UNDEFINED, f"ERROR: CODE 0x{length:02X}"
+        entry = DaliSerial._STATUS_TABLE.get(length)
+        if entry is None:
+            return DaliStatus.UNDEFINED, f"ERROR: CODE 0x{length:02X}"
+        return entry
+
+    # matches "{timestamp loopback-marker length data}" straight on the raw bytes
+    _LINE_PATTERN: Final = re.compile(
+        rb"\{([0-9A-Fa-f]{8})([ >])([0-9A-Fa-f]{2}) ([0-9A-Fa-f]{8})\}"
+    )
 
     @staticmethod
-    def parse(line: str) -> DaliFrame:
-        """parse a string into a DALI frame
+    def parse(line: bytes | bytearray) -> DaliFrame:
+        """parse a raw line into a DALI frame
 
         Args:
-            line (str): input string, curly braces around DALI information required
+            line (bytes | bytearray): raw input line, curly braces around DALI
+                information required
 
         Returns:
             DaliFrame: DALI frame
         """
-        timestamp: float = 0
-        length: int = 0
-        data: int = 0
-        try:
-            start = line.find("{") + 1
-            end = line.find("}")
-            payload = line[start:end]
-            timestamp = int(payload[0:8], 16) / 1000.0
-            loopback = payload[8] == ">"
-            length = int(payload[9:11], 16)
-            data = int(payload[12:20], 16)
+        match = DaliSerial._LINE_PATTERN.search(line)
+        if match is None:
+            return _PARSE_ERROR_FRAME
+        timestamp = int(match[1], 16) / 1000.0
+        loopback = match[2] == b">"
+        length = int(match[3], 16)
+        data = int(match[4], 16)
+        if length <= DaliSerial._MAX_BIT_LENGTH:
+            # fast path: a real frame, skip the status resolver call
+            status, message = _LOOPBACK_RESULT if loopback else _NORMAL_RESULT
+        else:
             status, message = DaliSerial.__get_status_and_last_error(
                 length, data, loopback
             )
-            return DaliFrame(
-                timestamp=timestamp,
-                length=length,
-                data=data,
-                status=status,
-                message=message,
-            )
-        except ValueError:
-            return DaliFrame(
-                timestamp=timestamp,
-                length=length,
-                data=data,
-                status=DaliStatus.GENERAL,
-                message="value error",
-            )
+        return DaliFrame(
+            timestamp=timestamp,
+            length=length,
+            data=data,
+            status=status,
+            message=message,
+        )
 
     def read_data(self) -> None:
-        """Read a line from the serial port."""
-        line = self.port.readline().decode("utf-8").strip()
-        if self.transparent:
-            print(line, end="")
-        if len(line) > 0:
-            logger.debug(f"received line <{line}> from serial")
-            self.queue.put(self.parse(line))
-
-    def _check_loopback(self, frame: DaliFrame) -> None:
-        loopback = self.get(DaliInterface.RECEIVE_TIMEOUT)
-        if (
-            loopback.status != DaliStatus.LOOPBACK
-            or loopback.data != frame.data
-            or loopback.length != loopback.length
-        ):
-            logger.error(f"unexpected loopback for frame {frame.data:X}")
+        """Read all available lines from the serial port."""
+        port = self.port
+        if self._selector is not None:
+            if not port.in_waiting:
+                ready = self._selector.select(timeout=port.timeout)
+                if not ready:
+                    return
+                if any(key.fd == self._wake_read for key, _ in ready):
+                    # close() poked the wake pipe; the worker loop checks
+                    # the stop event next
+                    os.read(self._wake_read, 64)
+                    return
+            # read whatever is pending straight from the descriptor,
+            # bypassing pyserial's Python-level read loop
+            chunk = os.read(self._fd, 4096)  # type: ignore[arg-type]
+        else:
+            chunk = port.read(port.in_waiting or 1)
+        if not chunk:
+            return
+        buffer = self._rx_buffer
+        buffer += chunk
+        if b"\n" not in chunk:
+            return
+        # the last piece is a partial line, keep it for the next chunk
+        *lines, remainder = buffer.split(b"\n")
+        self._rx_buffer = bytearray(remainder)
+        # bind the per-line callables to locals, the loop runs once per frame
+        put = self.queue.put
+        parse = self.parse
+        transparent = self.transparent
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for line in lines:
+            line = line.strip()
+            if transparent:
+                print(line.decode("utf-8"), end="")
+            if len(line) > 0:
+                if debug_enabled:
+                    logger.debug(f"received line <{line!r}> from serial")
+                put(parse(line))
+
+    def _check_loopbacks(self, frame: DaliFrame, expected: int = 1) -> None:
+        """Wait for the loopbacks of a transmitted frame, discarding stale
+        frames that were queued before the transmission. A send-twice frame
+        produces two loopbacks, awaited within one shared deadline."""
+        deadline = time.monotonic() + DaliInterface.RECEIVE_TIMEOUT
+        expected_loopback = (_LOOPBACK_STATUS, frame.length, frame.data)
+        seen = 0
+        while (remaining := deadline - time.monotonic()) > 0:
+            loopback = self.get(remaining)
+            if (loopback.status, loopback.length, loopback.data) == expected_loopback:
+                seen += 1
+                if seen == expected:
+                    return
+            elif loopback.status == _TIMEOUT_STATUS:
+                break
+        logger.error(f"unexpected loopback for frame {frame.data:X}")
 
     def transmit(self, frame: DaliFrame, block: bool = False) -> None:
         """Transmit a DALI frame via serial connector."""
-        command_string = DaliSerial.build_command_string(frame, False)
-        self.port.write(command_string.encode("utf-8"))
+        self.port.write(
+            self._encode_command(
+                frame.length, frame.data, frame.priority, frame.send_twice, False
+            )
+        )
+        if block:
+            self._check_loopbacks(frame, 2 if frame.send_twice else 1)
+
+    def _cancel_read(self) -> None:
+        """Abort a pending wait or blocking read so the worker thread exits
+        promptly."""
+        if self._selector is not None:
+            os.write(self._wake_write, b"x")
+            return
+        try:
+            self.port.cancel_read()
+        except AttributeError:
+            # pyserial >= 3.4 is required for cancel_read, otherwise the
+            # worker still terminates after the port timeout expires.
+            pass
+
+    def close(self) -> None:
+        """Close the connection to the serial DALI interface."""
+        super().close()
+        if self._selector is not None:
+            self._selector.close()
+            os.close(self._wake_read)
+            os.close(self._wake_write)
+            # allow repeated close() calls to stay a no-op
+            self._selector = None
+
+    def transmit_many(self, frames: list[DaliFrame], block: bool = False) -> None:
+        """Transmit several DALI frames with a single write to the serial
+        connector, avoiding one syscall per command.
+
+        Args:
+            frames (list[DaliFrame]): frames to transmit
+            block (bool, optional): wait for the end of all transmissions.
+                Defaults to False.
+        """
+        encode = self._encode_command
+        self.port.write(
+            b"".join(
+                encode(
+                    frame.length, frame.data, frame.priority, frame.send_twice, False
+                )
+                for frame in frames
+            )
+        )
         if block:
-            self._check_loopback(frame)
-            if frame.send_twice:
-                self._check_loopback(frame)
+            for frame in frames:
+                self._check_loopbacks(frame, 2 if frame.send_twice else 1)
 
     def query_reply(self, request: DaliFrame) -> DaliFrame:
         """Transmit a request DALI frame and wait for a reply frame."""
-        self.flush_queue()
-        command_string = DaliSerial.build_command_string(request, True)
-        self.port.write(command_string.encode("utf-8"))
-        self._check_loopback(request)
-        if request.send_twice:
-            self._check_loopback(request)
+        self.port.write(
+            self._encode_command(
+                request.length, request.data, request.priority, request.send_twice, True
+            )
+        )
+        self._check_loopbacks(request, 2 if request.send_twice else 1)
         logger.debug("read backframe")
         return self.get(timeout=DaliInterface.RECEIVE_TIMEOUT)